@@ -159,7 +159,7 @@ class VerilogPipeline:
             return None, "testbench", str(e)
         
         # Stage 3: Run simulation
-        result = self.sim_runner.run(verilog_code, testbench)
+        result = self.sim_runner.run(verilog_code, testbench, load_vcd=False)
         if not result.success:
             logger.debug(f"[{index}] Simulation failed: {result.error_message}")
             return None, "simulation", result.error_message
@@ -169,7 +169,7 @@ class VerilogPipeline:
             # Get I/O port names for filtering and port definitions for name formatting
             io_port_names = [p.name for p in module.ports]
             wavedrom_dict = vcd_to_wavedrom(
-                result.vcd_content, 
+                result.vcd_path,
                 io_port_names=io_port_names,
                 port_definitions=module.ports,  # Pass port definitions for signal naming
                 match_original=self.match_original  # Match original waveform images
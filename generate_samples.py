@@ -38,6 +38,7 @@ class GenerationStats:
     method1_failed: int = 0
     method2_success: int = 0
     method2_failed: int = 0
+    skipped: int = 0
     
     def summary(self) -> str:
         return (
@@ -47,6 +48,7 @@ class GenerationStats:
             f"  Files extracted: {self.extracted}\n"
             f"  Method 1 (simulation): {self.method1_success} success, {self.method1_failed} failed\n"
             f"  Method 2 (image): {self.method2_success} success, {self.method2_failed} failed\n"
+            f"  Up to date (skipped): {self.skipped}\n"
             f"{'='*50}"
         )
 
@@ -170,6 +172,44 @@ class SampleGenerator:
         
         return success
     
+    def is_up_to_date(
+        self,
+        sample: Dict[str, Any],
+        sample_name: str,
+        method1: bool = True,
+        method2: bool = True
+    ) -> bool:
+        """Check whether files from an earlier run can be reused for a sample.
+        
+        The extracted .v must hold the same Verilog as the dataset row (a
+        different seed or selection is regenerated), and every requested
+        method output must be at least as new as the .v file.
+        
+        Args:
+            sample: Sample dictionary with 'text' and 'image' fields
+            sample_name: Base name for files (e.g., 'sample_1')
+            method1: Require the Method 1 output ({sample_name}_wavedrom.json)
+            method2: Require the Method 2 output ({sample_name}_extracted.json)
+            
+        Returns:
+            True if nothing needs to be regenerated
+        """
+        v_path = self.output_dir / f"{sample_name}.v"
+        png_path = self.output_dir / f"{sample_name}.png"
+        if not v_path.exists() or not png_path.exists():
+            return False
+        if v_path.read_text(encoding='utf-8') != sample.get('text', ''):
+            return False
+        
+        outputs = []
+        if method1:
+            outputs.append(self.output_dir / f"{sample_name}_wavedrom.json")
+        if method2:
+            outputs.append(self.output_dir / f"{sample_name}_extracted.json")
+        
+        v_mtime = v_path.stat().st_mtime
+        return all(path.exists() and path.stat().st_mtime >= v_mtime for path in outputs)
+    
     def run_method1(self, sample_name: str) -> bool:
         """Run Method 1: Simulation-based WaveDrom generation.
         
@@ -222,7 +262,8 @@ class SampleGenerator:
         seed: int = None,
         extract_only: bool = False,
         method1_only: bool = False,
-        method2_only: bool = False
+        method2_only: bool = False,
+        skip_existing: bool = False
     ) -> GenerationStats:
         """Generate complete sample file sets.
         
@@ -232,6 +273,8 @@ class SampleGenerator:
             extract_only: Only extract original files, don't run methods
             method1_only: Only run method 1 (simulation)
             method2_only: Only run method 2 (image extraction)
+            skip_existing: Reuse a sample's files from an earlier run when
+                           they are up to date (see is_up_to_date)
             
         Returns:
             GenerationStats with results
@@ -242,6 +285,17 @@ class SampleGenerator:
         
         for i, sample in enumerate(samples, start=1):
             sample_name = f"sample_{i}"
+            
+            run_method1 = not extract_only and not method2_only
+            run_method2 = not extract_only and not method1_only
+            if skip_existing and self.is_up_to_date(sample, sample_name, run_method1, run_method2):
+                logger.info(f"[{i}/{len(samples)}] {sample_name} is up to date, skipping")
+                self.stats.skipped += 1
+                self.stats.extracted += 1
+                self.stats.method1_success += run_method1
+                self.stats.method2_success += run_method2
+                continue
+            
             logger.info(f"\n[{i}/{len(samples)}] Processing {sample_name}...")
             
             # Step 1: Extract original files
@@ -363,6 +417,11 @@ def main():
         action='store_true',
         help='Only run Method 2 (image extraction)'
     )
+    parser.add_argument(
+        '--skip-existing',
+        action='store_true',
+        help='Skip samples whose files from an earlier run are up to date'
+    )
     parser.add_argument(
         '--use-existing',
         action='store_true',
@@ -397,7 +456,8 @@ def main():
             seed=args.seed,
             extract_only=args.extract_only,
             method1_only=args.method1_only,
-            method2_only=args.method2_only
+            method2_only=args.method2_only,
+            skip_existing=args.skip_existing
         )
 
 
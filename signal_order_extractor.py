@@ -9,9 +9,13 @@ Supports multiple extraction methods:
 Then provides the order for matching generated WaveDrom output.
 """
 
+import hashlib
+import json
 import re
 import os
+import subprocess
 import sys
+import tempfile
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
@@ -38,11 +42,33 @@ if sys.platform == 'win32':
             break
 
 
+# reg/wire declarations: reg [7:0] name; or wire name; or reg name, name2;
+_REG_WIRE_DECL_RE = re.compile(
+    r'^\s*(reg|wire)\s*'
+    r'(?:\[[^\]]+\])?\s*'  # Optional bit range
+    r'([^;]+);',
+    re.MULTILINE
+)
+
+# Trailing bit range after a declared name (e.g. "mem [0:15]")
+_TRAILING_RANGE_RE = re.compile(r'\s*\[.*\]')
+
+# Version of stored OCR results (<image>.ocr_cache.json); bump it whenever the
+# OCR preprocessing, Tesseract configuration or name parsing changes
+_OCR_CACHE_VERSION = 1
+
+
 class SignalOrderExtractor:
     """Extract signal names and order from waveform images."""
     
-    def __init__(self):
-        """Initialize the extractor."""
+    def __init__(self, use_cache: bool = True):
+        """Initialize the extractor.
+        
+        Args:
+            use_cache: If True, reuse OCR results stored next to the image
+                       (<image>.ocr_cache.json) while the image is unchanged
+        """
+        self.use_cache = use_cache
         self.tesseract_available = TESSERACT_AVAILABLE
         if TESSERACT_AVAILABLE:
             try:
@@ -61,16 +87,203 @@ class SignalOrderExtractor:
         Returns:
             List of signal names in the order they appear (top to bottom)
         """
+        # Reuse a previous OCR result if the image has not changed
+        if self.use_cache:
+            cached = self._load_ocr_cache(image_path)
+            if cached is not None:
+                return cached
+        
         # Try Tesseract OCR first
         if self.tesseract_available:
             try:
-                return self._extract_with_tesseract(image_path)
+                signals = self._extract_with_tesseract(image_path)
+                if signals and self.use_cache:
+                    self._save_ocr_cache(image_path, signals)
+                return signals
             except Exception as e:
                 print(f"Tesseract OCR failed: {e}")
         
         # Fall back to image analysis (detect text regions by color)
         return self._extract_with_image_analysis(image_path)
     
+    def extract_signal_order_batch(self, image_paths: List[Path]) -> List[List[str]]:
+        """Extract signal names from many waveform images.
+        
+        All images are OCR'd by a single Tesseract invocation (image-list mode)
+        instead of paying Tesseract startup once per image. Images the batch
+        could not read fall back to extract_signal_order.
+        
+        Args:
+            image_paths: Paths to the waveform PNG images
+            
+        Returns:
+            List of signal name lists, in the same order as image_paths
+        """
+        results: Dict[Path, List[str]] = {}
+        
+        pending = []
+        for path in image_paths:
+            cached = self._load_ocr_cache(path) if self.use_cache else None
+            if cached is not None:
+                results[path] = cached
+            elif path not in pending:
+                pending.append(path)
+        
+        if pending and self.tesseract_available:
+            try:
+                batch = self._extract_batch_with_tesseract(pending)
+            except Exception as e:
+                print(f"Batch Tesseract OCR failed: {e}")
+                batch = {}
+            
+            for path, signals in batch.items():
+                if signals:
+                    results[path] = signals
+                    if self.use_cache:
+                        self._save_ocr_cache(path, signals)
+        
+        # Anything the batch missed goes through the single-image path
+        for path in image_paths:
+            if path not in results:
+                results[path] = self.extract_signal_order(path)
+        
+        return [results[path] for path in image_paths]
+    
+    def _extract_batch_with_tesseract(self, image_paths: List[Path]) -> Dict[Path, List[str]]:
+        """Run the bounding-box OCR strategy on several images with one Tesseract call per pass.
+        
+        Args:
+            image_paths: Paths to the waveform PNG images
+            
+        Returns:
+            Dictionary mapping image path to extracted signal names
+        """
+        preprocessed = []
+        for path in image_paths:
+            image = Image.open(path).convert('RGB')
+            signal_region = self._find_signal_name_region(image)
+            preprocessed.append(self._preprocess_for_ocr(signal_region, scale_factor=3))
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            # Tesseract treats a text file of image paths as a multi-page input
+            crop_paths = []
+            for i, image in enumerate(preprocessed):
+                crop_path = tmpdir / f"crop_{i}.png"
+                image.save(crop_path)
+                crop_paths.append(str(crop_path))
+            list_file = tmpdir / "imglist.txt"
+            list_file.write_text('\n'.join(crop_paths) + '\n', encoding='utf-8')
+            
+            # Same two passes as _extract_with_bounding_boxes
+            pages = self._run_tesseract_batch(list_file, tmpdir / "dense", ['--oem', '3', '--psm', '6'])
+            sparse_pages = self._run_tesseract_batch(list_file, tmpdir / "sparse", ['--oem', '3', '--psm', '11'])
+        
+        results = {}
+        for page_idx, (path, image) in enumerate(zip(image_paths, preprocessed)):
+            lines = self._group_ocr_words(pages.get(page_idx + 1, {}), min_conf=30)
+            sparse_lines = self._group_ocr_words(sparse_pages.get(page_idx + 1, {}), min_conf=20)
+            signals = self._lines_to_signal_names(self._merge_ocr_results(lines, sparse_lines))
+            
+            # If we found fewer signals than expected rows, try row-by-row OCR
+            signal_rows = self._find_signal_rows(image)
+            if len(signals) < len(signal_rows):
+                try:
+                    row_signals = self._extract_per_row(image, signal_rows)
+                    signals = self._merge_signal_lists(signals, row_signals)
+                except Exception as e:
+                    print(f"Row-by-row extraction failed: {e}")
+            
+            results[path] = self._post_process_signals(signals)
+        
+        return results
+    
+    def _run_tesseract_batch(
+        self,
+        list_file: Path,
+        output_base: Path,
+        options: List[str]
+    ) -> Dict[int, Dict[str, List[Any]]]:
+        """Run Tesseract once on an image list and parse its TSV output.
+        
+        Args:
+            list_file: Text file with one image path per line
+            output_base: Output path without extension (Tesseract appends .tsv)
+            options: Extra Tesseract command-line options
+            
+        Returns:
+            Dictionary mapping page number (1-based, one page per image) to
+            word data in the pytesseract.image_to_data DICT layout
+        """
+        cmd = [pytesseract.pytesseract.tesseract_cmd, str(list_file), str(output_base),
+               *options, '-c', 'tessedit_create_tsv=1']
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"tesseract failed: {result.stderr.strip()}")
+        
+        pages: Dict[int, Dict[str, List[Any]]] = {}
+        tsv_lines = output_base.with_suffix('.tsv').read_text(encoding='utf-8').splitlines()
+        for row in tsv_lines[1:]:  # Skip header
+            fields = row.split('\t')
+            if len(fields) < 12:
+                continue
+            page = pages.setdefault(int(fields[1]), {
+                'left': [], 'top': [], 'height': [], 'conf': [], 'text': []
+            })
+            page['left'].append(int(fields[6]))
+            page['top'].append(int(fields[7]))
+            page['height'].append(int(fields[9]))
+            page['conf'].append(fields[10])
+            page['text'].append(fields[11])
+        
+        return pages
+    
+    def _ocr_cache_path(self, image_path: Path) -> Path:
+        """Get the OCR cache file path for an image."""
+        return image_path.with_suffix('.ocr_cache.json')
+    
+    @staticmethod
+    def _image_digest(image_path: Path) -> str:
+        """Content hash of an image file."""
+        return hashlib.blake2b(image_path.read_bytes(), digest_size=16).hexdigest()
+    
+    def _load_ocr_cache(self, image_path: Path) -> Optional[List[str]]:
+        """Load cached OCR result for an image.
+        
+        The cache is keyed by a hash of the image content and by
+        _OCR_CACHE_VERSION, so changing either the image or the OCR code
+        invalidates it (rewriting an identical image does not).
+        
+        Returns:
+            Cached list of signal names, or None if missing or stale
+        """
+        cache_path = self._ocr_cache_path(image_path)
+        if not cache_path.exists():
+            return None
+        
+        try:
+            cache = json.loads(cache_path.read_text(encoding='utf-8'))
+            if (cache.get('version') == _OCR_CACHE_VERSION
+                    and cache.get('digest') == self._image_digest(image_path)):
+                return cache.get('signals', [])
+        except (OSError, ValueError):
+            pass
+        
+        return None
+    
+    def _save_ocr_cache(self, image_path: Path, signals: List[str]) -> None:
+        """Save OCR result for an image (best effort)."""
+        try:
+            cache = {
+                'version': _OCR_CACHE_VERSION,
+                'digest': self._image_digest(image_path),
+                'signals': signals
+            }
+            self._ocr_cache_path(image_path).write_text(json.dumps(cache), encoding='utf-8')
+        except OSError as e:
+            print(f"Failed to write OCR cache: {e}")
+    
     def _extract_with_tesseract(self, image_path: Path) -> List[str]:
         """Extract using Tesseract OCR with enhanced image processing.
         
@@ -443,6 +656,10 @@ class SignalOrderExtractor:
         # Merge results, preferring longer signal names
         merged_lines = self._merge_ocr_results(lines, sparse_lines)
         
+        return self._lines_to_signal_names(merged_lines)
+    
+    def _lines_to_signal_names(self, merged_lines: Dict[int, List[Tuple[int, str]]]) -> List[str]:
+        """Join OCR words line by line (top to bottom) into cleaned signal names."""
         # Sort lines by Y position and merge text on each line
         signal_names = []
         for y_pos in sorted(merged_lines.keys()):
@@ -469,13 +686,24 @@ class SignalOrderExtractor:
             Dictionary mapping Y positions to list of (x, text) tuples
         """
         data = pytesseract.image_to_data(image, config=config, output_type=pytesseract.Output.DICT)
+        return self._group_ocr_words(data, min_conf)
+    
+    def _group_ocr_words(self, data: Dict[str, List[Any]], min_conf: int) -> Dict[int, List[Tuple[int, str]]]:
+        """Group Tesseract word boxes into lines by their Y position.
         
+        Args:
+            data: Tesseract word data with 'text', 'conf', 'left', 'top' and 'height' lists
+            min_conf: Minimum confidence threshold
+            
+        Returns:
+            Dictionary mapping Y positions to list of (x, text) tuples
+        """
         lines = {}
-        n_boxes = len(data['text'])
+        n_boxes = len(data.get('text', []))
         
         for i in range(n_boxes):
             text = data['text'][i].strip()
-            conf = int(data['conf'][i])
+            conf = int(float(data['conf'][i]))
             
             # Skip empty text
             if not text:
@@ -671,21 +899,13 @@ class SignalOrderExtractor:
         signals = []
         
         # Match reg/wire declarations
-        # reg [7:0] name; or wire name; or reg name, name2;
-        pattern = re.compile(
-            r'^\s*(reg|wire)\s*'
-            r'(?:\[[^\]]+\])?\s*'  # Optional bit range
-            r'([^;]+);',
-            re.MULTILINE
-        )
-        
-        for match in pattern.finditer(verilog_code):
+        for match in _REG_WIRE_DECL_RE.finditer(verilog_code):
             names_str = match.group(2)
             # Split by comma and clean up
             for name in names_str.split(','):
                 name = name.strip()
                 # Remove any trailing bit range
-                name = re.sub(r'\s*\[.*\]', '', name)
+                name = _TRAILING_RANGE_RE.sub('', name)
                 if name and name.isidentifier():
                     signals.append(name)
         
@@ -943,7 +1163,14 @@ def fuzzy_match_score(ocr_name: str, signal_name: str) -> float:
     # Check if ocr_base is a suffix of sig_base
     if sig_base.endswith(ocr_base) and len(ocr_base) >= 3:
         return 0.85
-    
+
+    # Length lower bound: when one name is less than 34% as long as the other,
+    # containment and character similarity (prefix bonus included, at most
+    # 1.15x the length ratio) stay below the 0.4 reorder threshold
+    max_len = max(len(ocr_base), len(sig_base))
+    if abs(len(ocr_base) - len(sig_base)) > max_len * 0.66:
+        return 0.0
+
     # Check if one contains the other (with length check)
     if len(ocr_base) >= 3 and len(sig_base) >= 3:
         if ocr_base in sig_base:
@@ -952,7 +1179,6 @@ def fuzzy_match_score(ocr_name: str, signal_name: str) -> float:
             return 0.8 * (len(sig_base) / len(ocr_base))
     
     # Calculate character-level similarity using simple edit distance approximation
-    max_len = max(len(ocr_base), len(sig_base))
     if max_len == 0:
         return 0.0
     
@@ -1133,10 +1359,13 @@ def extract_and_match_order(
     """Extract signal order from original image and reorder WaveDrom to match.
     
     Tries multiple methods in order:
-    1. OCR from original image (requires Tesseract)
-    2. Signal order file (signal_order.txt in same directory)
+    1. Signal order file (signal_order.txt or <image>.order.txt alongside the image)
+    2. OCR from original image (requires Tesseract)
     3. Verilog declaration order (requires verilog_path)
     
+    Order files are checked first because they are definitive and cheap to
+    read, so OCR only runs when none is provided.
+    
     Args:
         original_image_path: Path to the original waveform image
         wavedrom_dict: WaveDrom dictionary to reorder
@@ -1150,31 +1379,30 @@ def extract_and_match_order(
     signal_order = []
     source = None
     
-    # Method 1: Try OCR extraction from image
-    if original_image_path and original_image_path.exists():
+    # Method 1: Try signal order file
+    order_file = original_image_path.parent / "signal_order.txt" if original_image_path else None
+    if order_file and order_file.exists():
+        signal_order = extractor.load_signal_order_file(order_file)
+        if signal_order:
+            source = "signal_order.txt"
+            print(f"Loaded signal order from {order_file}")
+    
+    # Also check for sample-specific order file
+    if not signal_order and original_image_path:
+        sample_order_file = original_image_path.with_suffix('.order.txt')
+        if sample_order_file.exists():
+            signal_order = extractor.load_signal_order_file(sample_order_file)
+            if signal_order:
+                source = "sample order file"
+                print(f"Loaded signal order from {sample_order_file}")
+    
+    # Method 2: Try OCR extraction from image
+    if not signal_order and original_image_path and original_image_path.exists():
         signal_order = extractor.extract_signal_order(original_image_path)
         if signal_order:
             source = "OCR"
             print(f"Extracted {len(signal_order)} signals via OCR: {signal_order}")
     
-    # Method 2: Try signal order file
-    if not signal_order:
-        order_file = original_image_path.parent / "signal_order.txt" if original_image_path else None
-        if order_file and order_file.exists():
-            signal_order = extractor.load_signal_order_file(order_file)
-            if signal_order:
-                source = "signal_order.txt"
-                print(f"Loaded signal order from {order_file}")
-        
-        # Also check for sample-specific order file
-        if not signal_order and original_image_path:
-            sample_order_file = original_image_path.with_suffix('.order.txt')
-            if sample_order_file.exists():
-                signal_order = extractor.load_signal_order_file(sample_order_file)
-                if signal_order:
-                    source = "sample order file"
-                    print(f"Loaded signal order from {sample_order_file}")
-    
     # Method 3: Use Verilog declaration order (but don't filter based on this)
     if not signal_order and verilog_path and verilog_path.exists():
         signal_order = extractor.extract_from_verilog(verilog_path)
@@ -1198,9 +1426,6 @@ def extract_and_match_order(
 
 
 if __name__ == "__main__":
-    import json
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python signal_order_extractor.py <image_path> [wavedrom_json_path]")
         sys.exit(1)
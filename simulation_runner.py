@@ -8,6 +8,7 @@ import os
 import shutil
 import subprocess
 import tempfile
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -20,9 +21,10 @@ class SimulationResult:
     """Result of a simulation run."""
     success: bool
     vcd_content: str = ""
+    vcd_path: Optional[Path] = None  # Set instead of vcd_content when load_vcd=False
     error_message: str = ""
-    compile_output: str = ""
-    run_output: str = ""
+    compile_output: str = ""  # iverilog stderr (warnings/errors)
+    run_output: str = ""  # vvp stderr; stdout ($display output) is discarded
 
 
 class SimulationRunner:
@@ -37,8 +39,16 @@ class SimulationRunner:
         """Check if simulation tools are available."""
         return self.iverilog_path is not None and self.vvp_path is not None
     
-    def run(self, verilog_code: str, testbench_code: str) -> SimulationResult:
-        """Run simulation and return VCD content."""
+    def run(self, verilog_code: str, testbench_code: str, load_vcd: bool = True) -> SimulationResult:
+        """Run simulation and return VCD content.
+        
+        Args:
+            verilog_code: DUT Verilog source
+            testbench_code: Testbench Verilog source
+            load_vcd: If True, read the VCD into ``vcd_content``. If False, leave
+                      it on disk and return its location in ``vcd_path`` instead;
+                      the file is removed when the result is garbage collected.
+        """
         if not self.check_tools():
             return SimulationResult(
                 success=False,
@@ -46,52 +56,79 @@ class SimulationRunner:
             )
         
         # Create temporary directory for simulation files
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            
-            # Write source files
-            dut_file = tmpdir / "dut.v"
-            tb_file = tmpdir / "testbench.v"
-            dut_file.write_text(verilog_code, encoding='utf-8')
-            tb_file.write_text(testbench_code, encoding='utf-8')
-            
-            # Compile
-            out_file = tmpdir / "sim.out"
-            compile_result = self._compile(dut_file, tb_file, out_file)
-            
-            if not compile_result.success:
-                return compile_result
-            
-            # Run simulation
-            vcd_file = tmpdir / "waveform.vcd"
-            run_result = self._run_simulation(out_file, tmpdir)
-            
-            if not run_result.success:
-                return run_result
-            
-            # Read VCD file
-            if vcd_file.exists():
-                vcd_content = vcd_file.read_text(encoding='utf-8')
-                return SimulationResult(
-                    success=True,
-                    vcd_content=vcd_content,
-                    compile_output=compile_result.compile_output,
-                    run_output=run_result.run_output
-                )
+        tmpdir = Path(tempfile.mkdtemp(prefix='sim_'))
+        result = None
+        try:
+            result = self._run_in_dir(tmpdir, verilog_code, testbench_code, load_vcd)
+        finally:
+            if result is not None and result.vcd_path is not None:
+                # Keep the VCD around for as long as the caller holds the result
+                weakref.finalize(result, shutil.rmtree, str(tmpdir), True)
             else:
-                return SimulationResult(
-                    success=False,
-                    error_message="VCD file not generated",
-                    compile_output=compile_result.compile_output,
-                    run_output=run_result.run_output
-                )
+                shutil.rmtree(tmpdir, ignore_errors=True)
+        
+        return result
+    
+    def _run_in_dir(
+        self,
+        tmpdir: Path,
+        verilog_code: str,
+        testbench_code: str,
+        load_vcd: bool
+    ) -> SimulationResult:
+        """Compile and simulate inside ``tmpdir``."""
+        # Write source files
+        dut_file = tmpdir / "dut.v"
+        tb_file = tmpdir / "testbench.v"
+        dut_file.write_text(verilog_code, encoding='utf-8')
+        tb_file.write_text(testbench_code, encoding='utf-8')
+        
+        # Compile
+        out_file = tmpdir / "sim.out"
+        compile_result = self._compile(dut_file, tb_file, out_file)
+        
+        if not compile_result.success:
+            return compile_result
+        
+        # Run simulation
+        vcd_file = tmpdir / "waveform.vcd"
+        run_result = self._run_simulation(out_file, tmpdir)
+        
+        if not run_result.success:
+            return run_result
+        
+        if not vcd_file.exists():
+            return SimulationResult(
+                success=False,
+                error_message="VCD file not generated",
+                compile_output=compile_result.compile_output,
+                run_output=run_result.run_output
+            )
+        
+        if not load_vcd:
+            return SimulationResult(
+                success=True,
+                vcd_path=vcd_file,
+                compile_output=compile_result.compile_output,
+                run_output=run_result.run_output
+            )
+        
+        # Read VCD file (VCD is plain ASCII, latin-1 skips UTF-8 validation)
+        vcd_content = vcd_file.read_text(encoding='latin-1')
+        return SimulationResult(
+            success=True,
+            vcd_content=vcd_content,
+            compile_output=compile_result.compile_output,
+            run_output=run_result.run_output
+        )
     
     def _compile(self, dut_file: Path, tb_file: Path, out_file: Path) -> SimulationResult:
         """Compile Verilog files."""
         try:
             result = subprocess.run(
                 [self.iverilog_path, '-o', str(out_file), str(dut_file), str(tb_file)],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=self.timeout
             )
@@ -100,12 +137,12 @@ class SimulationRunner:
                 return SimulationResult(
                     success=False,
                     error_message=f"Compilation failed: {result.stderr}",
-                    compile_output=result.stdout + result.stderr
+                    compile_output=result.stderr
                 )
             
             return SimulationResult(
                 success=True,
-                compile_output=result.stdout + result.stderr
+                compile_output=result.stderr
             )
             
         except subprocess.TimeoutExpired:
@@ -124,7 +161,9 @@ class SimulationRunner:
         try:
             result = subprocess.run(
                 [self.vvp_path, str(out_file)],
-                capture_output=True,
+                # Don't buffer $display/$monitor output; only the VCD file matters
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=self.timeout,
                 cwd=str(work_dir)
@@ -133,7 +172,7 @@ class SimulationRunner:
             # vvp may return non-zero even on success with $finish
             return SimulationResult(
                 success=True,
-                run_output=result.stdout + result.stderr
+                run_output=result.stderr
             )
             
         except subprocess.TimeoutExpired:
@@ -35,7 +35,7 @@ def test_sample(sample_path: Path):
     
     # Run simulation
     sim = SimulationRunner()
-    result = sim.run(verilog_code, testbench)
+    result = sim.run(verilog_code, testbench, load_vcd=False)
     print(f"\nSimulation: {'success' if result.success else 'FAILED'}")
     
     if not result.success:
@@ -44,7 +44,7 @@ def test_sample(sample_path: Path):
     
     # Convert to WaveDrom (match_original=True to include all signals in VCD order)
     wavedrom = vcd_to_wavedrom(
-        result.vcd_content,
+        result.vcd_path,
         io_port_names=[p.name for p in module.ports],
         port_definitions=module.ports,
         match_original=True  # Include all signals in VCD order to match original images
@@ -53,31 +53,21 @@ endmodule
         return testbench
     
     def _generate_signal_declarations(self, module: VerilogModule) -> str:
-        """Generate reg/wire declarations for testbench signals."""
-        lines = []
-        
-        for port in module.ports:
-            if port.direction in ('input', 'inout'):
-                # Inputs are driven by testbench, so use reg
-                sig_type = 'reg'
-            else:
-                # Outputs are driven by DUT, so use wire
-                sig_type = 'wire'
-            
-            if port.width > 1:
-                lines.append(f"{sig_type} [{port.width-1}:0] {port.name};")
-            else:
-                lines.append(f"{sig_type} {port.name};")
-        
-        return '\n'.join(lines)
+        """Generate reg/wire declarations for testbench signals.
+        
+        Inputs are driven by the testbench (reg), outputs by the DUT (wire).
+        """
+        return '\n'.join(
+            f"{'reg' if port.direction in ('input', 'inout') else 'wire'} "
+            f"{f'[{port.width-1}:0] ' if port.width > 1 else ''}{port.name};"
+            for port in module.ports
+        )
     
     def _generate_dut_instantiation(self, module: VerilogModule) -> str:
         """Generate DUT instantiation."""
-        connections = []
-        for port in module.ports:
-            connections.append(f"    .{port.name}({port.name})")
-        
-        connections_str = ',\n'.join(connections)
+        connections_str = ',\n'.join(
+            f"    .{port.name}({port.name})" for port in module.ports
+        )
         
         return f'''{module.name} dut (
 {connections_str}
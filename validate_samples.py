@@ -9,14 +9,23 @@ This script:
 """
 
 import json
+import os
 import random
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from PIL import Image
 
+# Try to import orjson (optional, faster JSON encoding/decoding)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -25,6 +34,10 @@ from generate_samples import SampleGenerator
 from signal_order_extractor import SignalOrderExtractor
 
 
+# Characters ignored when comparing OCR names with generated names
+_BIT_RANGE_CHARS = str.maketrans('', '', '[]:')
+
+
 @dataclass
 class ValidationResult:
     """Result of validating a single sample."""
@@ -39,23 +52,80 @@ class ValidationResult:
     error: str = ""
 
 
-def count_signals_in_image(image_path: Path) -> int:
+def count_signals_in_image(image_path: Path, extractor: SignalOrderExtractor = None) -> int:
     """Estimate number of signals in a waveform image by counting blue text rows."""
-    extractor = SignalOrderExtractor()
-    signals = extractor.extract_signal_order(image_path)
-    return len(signals)
+    extractor = extractor or SignalOrderExtractor()
+    return len(extractor.extract_signal_order(image_path))
 
 
 def get_signals_from_json(json_path: Path) -> List[str]:
     """Get signal names from WaveDrom JSON."""
     if not json_path.exists():
         return []
-    data = json.loads(json_path.read_text(encoding='utf-8'))
+    if ORJSON_AVAILABLE:
+        data = orjson.loads(json_path.read_bytes())
+    else:
+        data = json.loads(json_path.read_text(encoding='utf-8'))
     return [sig.get('name', '') for sig in data.get('signal', [])]
 
 
-def validate_sample(output_dir: Path, sample_name: str) -> ValidationResult:
-    """Validate a single sample."""
+def _ocr_batch(extractor: SignalOrderExtractor, image_paths: List[Path]) -> List[List[str]]:
+    """OCR one chunk of images with a single batched Tesseract run (process pool task)."""
+    return extractor.extract_signal_order_batch(image_paths)
+
+
+def ocr_images_parallel(
+    extractor: SignalOrderExtractor,
+    image_paths: List[Path],
+    workers: int = None
+) -> Dict[Path, List[str]]:
+    """OCR many images, split into one batched Tesseract run per worker process.
+    
+    Args:
+        extractor: Signal order extractor (pickled into the workers, so
+                   Tesseract is checked once)
+        image_paths: Paths to the waveform PNG images
+        workers: Number of worker processes (default: CPU count)
+        
+    Returns:
+        Signal names for each image path
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(image_paths)))
+    if workers == 1:
+        return dict(zip(image_paths, extractor.extract_signal_order_batch(image_paths)))
+    
+    # Contiguous, near-equal chunks: image preprocessing and the per-row
+    # fallbacks run in Python, so each worker takes a share of the pages
+    size, extra = divmod(len(image_paths), workers)
+    chunks = []
+    start = 0
+    for k in range(workers):
+        end = start + size + (1 if k < extra else 0)
+        chunks.append(image_paths[start:end])
+        start = end
+    
+    ocr_by_path = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk, signals in zip(chunks, executor.map(_ocr_batch, [extractor] * workers, chunks)):
+            ocr_by_path.update(zip(chunk, signals))
+    return ocr_by_path
+
+
+def validate_sample(
+    output_dir: Path,
+    sample_name: str,
+    extractor: SignalOrderExtractor = None,
+    ocr_signals: List[str] = None
+) -> ValidationResult:
+    """Validate a single sample.
+    
+    Args:
+        output_dir: Directory containing the sample files
+        sample_name: Base name of the sample (e.g., 'sample_1')
+        extractor: Shared signal order extractor (created if not given)
+        ocr_signals: Signal names already OCR'd from the original image
+                     (extracted here if not given)
+    """
     result = ValidationResult(sample_name=sample_name)
     
     try:
@@ -73,8 +143,10 @@ def validate_sample(output_dir: Path, sample_name: str) -> ValidationResult:
             return result
         
         # Extract signals from original image
-        extractor = SignalOrderExtractor()
-        result.ocr_signals = extractor.extract_signal_order(original_png)
+        if ocr_signals is None:
+            extractor = extractor or SignalOrderExtractor()
+            ocr_signals = extractor.extract_signal_order(original_png)
+        result.ocr_signals = list(ocr_signals)
         result.original_signal_count = len(result.ocr_signals)
         
         # Get signals from generated JSON
@@ -83,21 +155,18 @@ def validate_sample(output_dir: Path, sample_name: str) -> ValidationResult:
         
         # Compare signals
         if result.generated_signal_count > 0:
-            # Count how many OCR signals match generated signals
-            ocr_lower = [s.lower() for s in result.ocr_signals]
-            gen_lower = [s.lower() for s in result.generated_signals]
+            # Normalize names once: drop bit-range punctuation (and 'out_' on generated names)
+            ocr_bases = [s.lower().translate(_BIT_RANGE_CHARS) for s in result.ocr_signals]
+            gen_bases = [
+                s.lower().replace('out_', '').translate(_BIT_RANGE_CHARS)
+                for s in result.generated_signals
+            ]
             
             # Simple matching - check if generated signals are in same order as OCR
-            matched = 0
-            for i, gen_sig in enumerate(gen_lower):
-                if i < len(ocr_lower):
-                    # Check fuzzy match
-                    ocr_sig = ocr_lower[i]
-                    # Normalize for comparison
-                    gen_base = gen_sig.replace('out_', '').replace('[', '').replace(']', '').replace(':', '')
-                    ocr_base = ocr_sig.replace('[', '').replace(']', '').replace(':', '')
-                    if gen_base in ocr_base or ocr_base in gen_base or gen_base == ocr_base:
-                        matched += 1
+            matched = sum(
+                1 for gen_base, ocr_base in zip(gen_bases, ocr_bases)
+                if gen_base in ocr_base or ocr_base in gen_base
+            )
             
             result.matched_signals = matched
             result.order_match = matched >= len(result.generated_signals) * 0.8  # 80% match threshold
@@ -109,8 +178,23 @@ def validate_sample(output_dir: Path, sample_name: str) -> ValidationResult:
     return result
 
 
-def run_validation(num_samples: int = 10, seed: int = 42):
-    """Run validation on specified number of samples."""
+def run_validation(
+    num_samples: int = 10,
+    seed: int = 42,
+    extractor: SignalOrderExtractor = None,
+    workers: int = None,
+    incremental: bool = False
+):
+    """Run validation on specified number of samples.
+    
+    Args:
+        num_samples: Number of samples to extract and validate
+        seed: Random seed for sample selection
+        extractor: Signal order extractor shared by all samples (created if not given)
+        workers: Number of worker processes for OCR (default: CPU count)
+        incremental: Skip regenerating samples whose outputs from an earlier
+                     run are still up to date
+    """
     print(f"=" * 60)
     print(f"Verilog-WaveDrom Signal Order Extraction Validation")
     print(f"=" * 60)
@@ -131,19 +215,31 @@ def run_validation(num_samples: int = 10, seed: int = 42):
     stats = generator.generate(
         count=num_samples,
         seed=seed,
-        method1_only=True  # Only use simulation method
+        method1_only=True,  # Only use simulation method
+        skip_existing=incremental
     )
     
     print()
     print(f"Step 2: Validating signal extraction...")
     print("-" * 60)
     
-    # Validate each sample
+    # OCR all original images up front, one batched Tesseract run per worker
+    extractor = extractor or SignalOrderExtractor()
+    sample_names = [f"sample_{i}" for i in range(1, num_samples + 1)]
+    original_pngs = [
+        png for png in (output_dir / f"{name}.png" for name in sample_names)
+        if png.exists()
+    ]
+    ocr_by_png = ocr_images_parallel(extractor, original_pngs, workers)
+    
+    # With OCR done, each sample is only a JSON load and a list comparison
     results = []
-    for i in range(1, num_samples + 1):
-        sample_name = f"sample_{i}"
+    for sample_name in sample_names:
         print(f"  Validating {sample_name}...", end=" ")
-        result = validate_sample(output_dir, sample_name)
+        result = validate_sample(
+            output_dir, sample_name, extractor,
+            ocr_by_png.get(output_dir / f"{sample_name}.png")
+        )
         results.append(result)
         
         if result.success:
@@ -205,7 +301,10 @@ def run_validation(num_samples: int = 10, seed: int = 42):
             for r in results
         ]
     }
-    report_path.write_text(json.dumps(report_data, indent=2, ensure_ascii=False))
+    if ORJSON_AVAILABLE:
+        report_path.write_bytes(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+    else:
+        report_path.write_text(json.dumps(report_data, indent=2, ensure_ascii=False))
     print(f"\nDetailed report saved to: {report_path}")
     
     return results
@@ -219,7 +318,11 @@ if __name__ == "__main__":
                         help='Number of samples to validate (default: 10)')
     parser.add_argument('-s', '--seed', type=int, default=42,
                         help='Random seed for sample selection (default: 42)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of parallel OCR worker processes (default: CPU count)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Reuse up-to-date samples from a previous run instead of regenerating them')
     
     args = parser.parse_args()
     
-    run_validation(args.num_samples, args.seed)
+    run_validation(args.num_samples, args.seed, workers=args.jobs, incremental=args.incremental)
@@ -5,10 +5,24 @@ Parses Value Change Dump (VCD) files and generates WaveDrom JSON
 for waveform visualization.
 """
 
+import functools
+import heapq
 import json
+import mmap
+import os
 import re
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any, TYPE_CHECKING
+
+# Try to import orjson (optional, faster JSON encoding)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 import config
 
@@ -16,23 +30,78 @@ if TYPE_CHECKING:
     from verilog_parser import Port
 
 
+# Header directives
+_SCOPE_RE = re.compile(r'\$scope\s+(\w+)\s+(\w+)')
+_VAR_RE = re.compile(r'\$var\s+(\w+)\s+(\d+)\s+(\S+)\s+(\S+)(?:\s+\[[\d:]+\])?\s*\$end')
+_TIMESCALE_RE = re.compile(r'(\d+\s*\w+)')
+
+# Names drawn as a periodic clock ("clk" or "clock" anywhere, any case)
+_CLOCK_NAME_RE = re.compile(r'cl(?:k|ock)', re.IGNORECASE)
+
+# Value change section, scanned as bytes: one match per "#<time>", "b<bits> <id>"
+# or "<bit><id>" line. Anything else ($dumpvars, $end, real values, ...) is skipped.
+_ENDDEFINITIONS_RE = re.compile(rb'^[ \t]*\$enddefinitions[^\n]*\n?', re.MULTILINE)
+_VALUE_CHANGE_RE = re.compile(
+    rb'^[ \t]*(?:'
+    rb'#(\d+)[ \t\r]*$'                 # 1: timestamp
+    rb'|[bB]([01xXzZ]+)[ \t]+(\S+)'      # 2, 3: vector value and id
+    rb'|([01xXzZ])[ \t]*(\S+)'           # 4, 5: scalar value and id
+    rb')',
+    re.MULTILINE
+)
+
+
 @dataclass
 class VCDSignal:
-    """Represents a signal in a VCD file."""
+    """Represents a signal in a VCD file.
+    
+    Value changes are stored as two parallel sequences in ascending time
+    order: ``times[i]`` is when the signal changed to ``vals[i]``.
+    """
     id: str
     name: str
     width: int
     scope: str = ""
-    values: List[Tuple[int, str]] = field(default_factory=list)  # (time, value)
+    times: array = field(default_factory=lambda: array('q'))
+    vals: List[str] = field(default_factory=list)
+    name_lower: str = field(init=False, repr=False, compare=False)
+    is_clock: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
+        self.is_clock = bool(_CLOCK_NAME_RE.search(self.name))
+    
+    @property
+    def values(self) -> List[Tuple[int, str]]:
+        """Value changes as (time, value) pairs."""
+        return list(zip(self.times, self.vals))
     
     def get_value_at(self, time: int) -> str:
         """Get signal value at a specific time."""
-        last_value = 'x'
-        for t, v in self.values:
-            if t > time:
-                break
-            last_value = v
-        return last_value
+        i = bisect_right(self.times, time) - 1
+        return self.vals[i] if i >= 0 else 'x'
+    
+    def sample_values(self, time_step: int, num_steps: int) -> List[str]:
+        """Get signal values at times 0, time_step, 2*time_step, ...
+        
+        Walks the change list once alongside the sample times instead of
+        searching it for every step.
+        """
+        times, vals = self.times, self.vals
+        n = len(times)
+        samples = []
+        append = samples.append
+        value = 'x'
+        nxt = 0   # first change not yet applied
+        for step in range(num_steps):
+            time = step * time_step
+            if nxt < n and times[nxt] <= time:
+                nxt += 1
+                while nxt < n and times[nxt] <= time:
+                    nxt += 1
+                value = vals[nxt - 1]
+            append(value)
+        return samples
 
 
 @dataclass
@@ -55,22 +124,61 @@ class VCDParser:
     
     def parse(self, vcd_content: str) -> VCDData:
         """Parse VCD content and return structured data."""
+        return self._parse_buffer(vcd_content.encode('utf-8'))
+    
+    def parse_file(self, vcd_path: Path) -> VCDData:
+        """Parse a VCD file without reading it into memory.
+        
+        The file is memory-mapped and scanned in place; only the header and
+        the matched value change tokens are decoded.
+        """
+        with open(vcd_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return self._parse_buffer(b'')
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._parse_buffer(mm)
+    
+    def _parse_buffer(self, buf: Union[bytes, mmap.mmap]) -> VCDData:
+        """Parse a VCD held in a bytes-like buffer."""
+        self._reset()
+        
+        end_match = _ENDDEFINITIONS_RE.search(buf)
+        body_start = end_match.end() if end_match else len(buf)
+        
+        header = buf[:body_start].decode('utf-8', errors='replace')
+        self._parse_header(iter(header.split('\n')))
+        self._parse_value_changes(buf, body_start)
+        
+        return self._result()
+    
+    def _reset(self) -> None:
+        """Clear state from a previous parse."""
         self.signals = {}
         self.id_to_signal = {}
         self.current_scope = []
+        self.timescale = "1ns"
         self.end_time = 0
-        
-        lines = vcd_content.split('\n')
-        i = 0
-        
-        # Parse header section
-        while i < len(lines):
-            line = lines[i].strip()
+    
+    def _result(self) -> VCDData:
+        """Package the parsed state as VCDData."""
+        return VCDData(
+            timescale=self.timescale,
+            signals=self.signals,
+            end_time=self.end_time
+        )
+    
+    def _parse_header(self, lines: Iterator[str]) -> None:
+        """Parse header lines up to and including $enddefinitions."""
+        for line in lines:
+            line = line.strip()
             
+            # Every directive starts with '$'; skip continuation/blank lines
+            if line[:1] != '$':
+                continue
             if line.startswith('$timescale'):
-                i, self.timescale = self._parse_timescale(lines, i)
+                self.timescale = self._parse_timescale(line, lines)
             elif line.startswith('$scope'):
-                scope_match = re.match(r'\$scope\s+(\w+)\s+(\w+)', line)
+                scope_match = _SCOPE_RE.match(line)
                 if scope_match:
                     self.current_scope.append(scope_match.group(2))
             elif line.startswith('$upscope'):
@@ -79,75 +187,66 @@ class VCDParser:
             elif line.startswith('$var'):
                 self._parse_var(line)
             elif line.startswith('$enddefinitions'):
-                i += 1
                 break
-            
-            i += 1
+    
+    def _parse_value_changes(self, buf: Union[bytes, mmap.mmap], pos: int) -> None:
+        """Record the value changes in buf[pos:].
+        
+        ``pos`` must be at the start of a line.
+        """
+        id_to_signal = {
+            sig_id.encode('utf-8'): signal for sig_id, signal in self.id_to_signal.items()
+        }
+        
+        # Decoded value strings, shared by every change to the same value
+        decoded = {}
         
-        # Parse value changes
         current_time = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            if not line:
-                i += 1
+        end_time = self.end_time
+        for match in _VALUE_CHANGE_RE.finditer(buf, pos):
+            time_str, vec_value, vec_id, bit_value, bit_id = match.groups()
+            if time_str:
+                current_time = int(time_str)
+                if current_time > end_time:
+                    end_time = current_time
                 continue
             
-            if line.startswith('#'):
-                # Timestamp
-                try:
-                    current_time = int(line[1:])
-                    self.end_time = max(self.end_time, current_time)
-                except ValueError:
-                    pass
-            elif line.startswith('$'):
-                # Skip VCD commands in value section
-                pass
-            elif line.startswith('b') or line.startswith('B'):
-                # Binary value for multi-bit signal
-                match = re.match(r'[bB]([01xXzZ]+)\s+(\S+)', line)
-                if match:
-                    value, sig_id = match.groups()
-                    self._record_value(sig_id, current_time, value)
-            elif len(line) >= 2 and line[0] in '01xXzZ':
-                # Single bit value
-                value = line[0]
-                sig_id = line[1:].strip()
-                self._record_value(sig_id, current_time, value)
-            
-            i += 1
-        
-        return VCDData(
-            timescale=self.timescale,
-            signals=self.signals,
-            end_time=self.end_time
-        )
+            if vec_id:
+                signal = id_to_signal.get(vec_id)
+                value = vec_value
+            else:
+                signal = id_to_signal.get(bit_id)
+                value = bit_value
+            if signal is not None:
+                value_str = decoded.get(value)
+                if value_str is None:
+                    value_str = decoded[value] = value.decode('ascii').lower()
+                signal.times.append(current_time)
+                signal.vals.append(value_str)
+        self.end_time = end_time
     
-    def _parse_timescale(self, lines: List[str], start_idx: int) -> Tuple[int, str]:
-        """Parse timescale directive."""
-        i = start_idx
-        content = []
-        while i < len(lines):
-            line = lines[i].strip()
-            content.append(line)
-            if '$end' in line:
+    def _parse_timescale(self, first_line: str, lines: Iterator[str]) -> str:
+        """Parse timescale directive, consuming lines up to its $end."""
+        line = first_line
+        content = [line]
+        while '$end' not in line:
+            line = next(lines, None)
+            if line is None:
                 break
-            i += 1
+            line = line.strip()
+            content.append(line)
         
         full_line = ' '.join(content)
-        match = re.search(r'(\d+\s*\w+)', full_line)
+        match = _TIMESCALE_RE.search(full_line)
         if match:
-            return i, match.group(1).replace(' ', '')
-        return i, "1ns"
+            return match.group(1).replace(' ', '')
+        return "1ns"
     
     def _parse_var(self, line: str) -> None:
         """Parse variable declaration."""
         # $var wire 8 ! data [7:0] $end
         # $var reg 1 " clk $end
-        match = re.match(
-            r'\$var\s+(\w+)\s+(\d+)\s+(\S+)\s+(\S+)(?:\s+\[[\d:]+\])?\s*\$end',
-            line
-        )
+        match = _VAR_RE.match(line)
         if match:
             var_type, width, sig_id, name = match.groups()
             scope = '.'.join(self.current_scope)
@@ -162,11 +261,6 @@ class VCDParser:
             
             self.signals[full_name] = signal
             self.id_to_signal[sig_id] = signal
-    
-    def _record_value(self, sig_id: str, time: int, value: str) -> None:
-        """Record a value change for a signal."""
-        if sig_id in self.id_to_signal:
-            self.id_to_signal[sig_id].values.append((time, value.lower()))
 
 
 class WaveDromGenerator:
@@ -196,6 +290,16 @@ class WaveDromGenerator:
         ['addr', 'address', 'data'],
     ]
     
+    # SIGNAL_GROUPS flattened in priority order: (pattern, group_idx, pattern_idx)
+    _GROUP_PATTERNS = tuple(
+        (pattern, group_idx, pattern_idx)
+        for group_idx, group_patterns in enumerate(SIGNAL_GROUPS)
+        for pattern_idx, pattern in enumerate(group_patterns)
+    )
+    
+    # WaveDrom wave characters for single-bit values (anything else is 'x')
+    SINGLE_BIT_WAVE_CHARS = {'0': '0', '1': '1', 'x': 'x', 'X': 'x', 'z': 'z', 'Z': 'z'}
+    
     # Internal signal patterns to exclude
     INTERNAL_SIGNAL_PATTERNS = [
         'i',        # Loop variables
@@ -207,6 +311,11 @@ class WaveDromGenerator:
         'cnt_',     # Internal counters (but keep exposed ones)
     ]
     
+    # A name that is exactly one of the patterns or starts with "<pattern>_"
+    _INTERNAL_NAME_RE = re.compile(
+        '(?:' + '|'.join(map(re.escape, INTERNAL_SIGNAL_PATTERNS)) + r')(?:_|\Z)'
+    )
+    
     def __init__(
         self,
         max_signals: int = None,
@@ -248,7 +357,7 @@ class WaveDromGenerator:
     
     def _is_internal_signal(self, signal: VCDSignal) -> bool:
         """Check if a signal is likely an internal signal (not I/O port)."""
-        name_lower = signal.name.lower()
+        name_lower = signal.name_lower
         
         # If we have a list of I/O port names, use it
         if self.io_port_names:
@@ -260,12 +369,9 @@ class WaveDromGenerator:
             return True
         
         # Check against internal signal patterns
-        for pattern in self.INTERNAL_SIGNAL_PATTERNS:
-            if signal.name == pattern or signal.name.startswith(pattern + '_'):
-                # But allow signals that are also common I/O names
-                if name_lower in ['cnt', 'count', 'counter']:
-                    return False
-                return True
+        if self._INTERNAL_NAME_RE.match(signal.name):
+            # But allow signals that are also common I/O names
+            return name_lower not in ('cnt', 'count', 'counter')
         
         # Signals with 'internal' or 'reg' in scope are internal
         if 'internal' in signal.scope.lower():
@@ -283,30 +389,37 @@ class WaveDromGenerator:
             Full signal name with bit range (e.g., 'data[7:0]') if port definition exists,
             otherwise the original signal name.
         """
-        name_lower = signal.name.lower()
+        name_lower = signal.name_lower
         if name_lower in self.port_name_map:
             port = self.port_name_map[name_lower]
             return port.get_full_name()
         return signal.name
     
-    def _sort_by_port_order(self, signals: List[VCDSignal]) -> List[VCDSignal]:
+    def _sort_by_port_order(
+        self,
+        signals: List[VCDSignal],
+        limit: Optional[int] = None
+    ) -> List[VCDSignal]:
         """Sort signals by Verilog port definition order.
         
         Args:
             signals: List of VCD signals to sort
+            limit: If given, return only the first ``limit`` signals
             
         Returns:
             Signals sorted by the order they appear in the Verilog port definitions.
             Signals not found in port definitions are placed at the end.
         """
         if not self.port_definitions:
-            return signals
+            return signals[:limit]
         
         port_order = {p.name.lower(): i for i, p in enumerate(self.port_definitions)}
         
         def order_key(sig: VCDSignal) -> int:
-            return port_order.get(sig.name.lower(), 999)
+            return port_order.get(sig.name_lower, 999)
         
+        if limit is not None:
+            return heapq.nsmallest(limit, signals, key=order_key)
         return sorted(signals, key=order_key)
     
     def generate(self, vcd_data: VCDData, io_port_names: List[str] = None) -> Dict[str, Any]:
@@ -329,17 +442,14 @@ class WaveDromGenerator:
         if self.io_ports_only:
             signals_list = [s for s in signals_list if not self._is_internal_signal(s)]
         
-        # Sort signals based on settings
+        # Sort signals based on settings, keeping at most max_signals
         if self.use_vcd_order:
             # Keep original VCD order (order signals appear in VCD file)
-            sorted_signals = signals_list
+            signals_to_show = signals_list[:self.max_signals]
         elif self.use_port_order and self.port_definitions:
-            sorted_signals = self._sort_by_port_order(signals_list)
+            signals_to_show = self._sort_by_port_order(signals_list, self.max_signals)
         else:
-            sorted_signals = self._sort_signals_by_group(signals_list)
-        
-        # Limit number of signals
-        signals_to_show = sorted_signals[:self.max_signals]
+            signals_to_show = self._sort_signals_by_group(signals_list, self.max_signals)
         
         # Determine time step
         time_step = self._calculate_time_step(vcd_data)
@@ -359,26 +469,39 @@ class WaveDromGenerator:
             "foot": self.wavedrom_foot.copy()
         }
     
-    def _sort_signals_by_group(self, signals: List[VCDSignal]) -> List[VCDSignal]:
-        """Sort signals by logical groups for better visual organization."""
+    def _sort_signals_by_group(
+        self,
+        signals: List[VCDSignal],
+        limit: Optional[int] = None
+    ) -> List[VCDSignal]:
+        """Sort signals by logical groups for better visual organization.
+        
+        If ``limit`` is given, only the first ``limit`` signals are returned
+        (selected with a bounded heap rather than a full sort).
+        """
+        group_patterns = self._GROUP_PATTERNS
+        other_group = len(self.SIGNAL_GROUPS)
+        
         def group_key(sig: VCDSignal) -> Tuple[int, int, str]:
-            name_lower = sig.name.lower()
+            name_lower = sig.name_lower
+            startswith, endswith = name_lower.startswith, name_lower.endswith
             
-            # Find which group this signal belongs to
-            for group_idx, group_patterns in enumerate(self.SIGNAL_GROUPS):
-                for pattern_idx, pattern in enumerate(group_patterns):
-                    if pattern == name_lower or name_lower.startswith(pattern) or name_lower.endswith(pattern):
-                        return (group_idx, pattern_idx, sig.name)
+            # First pattern the name starts or ends with (an exact match does both)
+            for pattern, group_idx, pattern_idx in group_patterns:
+                if startswith(pattern) or endswith(pattern):
+                    return (group_idx, pattern_idx, sig.name)
             
             # Signals not in any group go last
-            return (len(self.SIGNAL_GROUPS), 0, sig.name)
+            return (other_group, 0, sig.name)
         
+        if limit is not None:
+            return heapq.nsmallest(limit, signals, key=group_key)
         return sorted(signals, key=group_key)
     
     def _sort_signals(self, signals: List[VCDSignal]) -> List[VCDSignal]:
         """Sort signals by priority (clocks and resets first). Legacy method."""
         def priority_key(sig: VCDSignal) -> Tuple[int, str]:
-            name_lower = sig.name.lower()
+            name_lower = sig.name_lower
             for i, pattern in enumerate(self.signal_priority):
                 if pattern in name_lower:
                     return (i, sig.name)
@@ -393,9 +516,9 @@ class WaveDromGenerator:
         
         # Try to find the clock period
         for signal in vcd_data.signals.values():
-            if 'clk' in signal.name.lower() and signal.values:
+            if 'clk' in signal.name_lower and signal.times:
                 # Find minimum time between transitions
-                transitions = [t for t, _ in signal.values if t > 0]
+                transitions = [t for t in signal.times if t > 0]
                 if len(transitions) >= 2:
                     min_period = min(
                         transitions[i+1] - transitions[i] 
@@ -414,7 +537,7 @@ class WaveDromGenerator:
         end_time: int
     ) -> Optional[Dict[str, Any]]:
         """Generate a WaveDrom wave entry for a signal."""
-        if not signal.values:
+        if not signal.times:
             return None
         
         num_steps = min(self.max_time_steps, max(1, end_time // time_step))
@@ -431,36 +554,16 @@ class WaveDromGenerator:
         num_steps: int
     ) -> Dict[str, Any]:
         """Generate wave string for single-bit signal."""
-        wave = ""
-        last_value = None
-        
-        # Check if this is a clock signal
-        is_clock = 'clk' in signal.name.lower() or 'clock' in signal.name.lower()
-        
-        for step in range(num_steps):
-            time = step * time_step
-            value = signal.get_value_at(time)
-            
-            if is_clock and step > 0:
-                # Use 'p' or 'n' for clock signals
-                if step == 1:
-                    wave = 'p' + '.' * (num_steps - 1)
-                    break
-            
-            if value == last_value:
-                wave += '.'
-            elif value == '1':
-                wave += '1'
-            elif value == '0':
-                wave += '0'
-            elif value in ('x', 'X'):
-                wave += 'x'
-            elif value in ('z', 'Z'):
-                wave += 'z'
-            else:
-                wave += 'x'
-            
-            last_value = value
+        if signal.is_clock and num_steps > 1:
+            # Use 'p' for clock signals
+            wave = 'p' + '.' * (num_steps - 1)
+        else:
+            # One pass over the samples: '.' where unchanged, else the level char
+            samples = signal.sample_values(time_step, num_steps)
+            wave = ''.join(
+                '.' if value == last_value else self.SINGLE_BIT_WAVE_CHARS.get(value, 'x')
+                for last_value, value in zip([None] + samples, samples)
+            )
         
         # Use display name with bit range if available
         display_name = self._get_display_name(signal)
@@ -473,32 +576,22 @@ class WaveDromGenerator:
         num_steps: int
     ) -> Dict[str, Any]:
         """Generate wave string for multi-bit signal."""
-        wave = ""
+        wave_chars = []
+        append = wave_chars.append
         data = []
         last_value = None
         
-        for step in range(num_steps):
-            time = step * time_step
-            value = signal.get_value_at(time)
-            
+        for value in signal.sample_values(time_step, num_steps):
             if value == last_value:
-                wave += '.'
+                append('.')
             else:
-                # Check for x or z values
-                if 'x' in value.lower():
-                    wave += 'x'
-                elif 'z' in value.lower():
-                    wave += 'z'
-                else:
-                    wave += '='
-                    # Convert binary to hex for display
-                    try:
-                        hex_val = format(int(value, 2), 'X')
-                        data.append(hex_val)
-                    except ValueError:
-                        data.append(value[:8])  # Truncate long values
+                wave_char, label = _multi_bit_wave_char(value)
+                append(wave_char)
+                if label is not None:
+                    data.append(label)
             
             last_value = value
+        wave = ''.join(wave_chars)
         
         # Use display name with bit range if available
         display_name = self._get_display_name(signal)
@@ -508,8 +601,36 @@ class WaveDromGenerator:
         return result
 
 
+@functools.lru_cache(maxsize=4096)
+def _multi_bit_wave_char(value: str) -> Tuple[str, Optional[str]]:
+    """Wave char and data label for a multi-bit value.
+    
+    Values recur (counters, buses), so each distinct one is converted once.
+    """
+    # Check for x or z values
+    value_lower = value.lower()
+    if 'x' in value_lower:
+        return 'x', None
+    if 'z' in value_lower:
+        return 'z', None
+    # Convert binary to hex for display
+    try:
+        return '=', format(int(value, 2), 'X')
+    except ValueError:
+        return '=', value[:8]  # Truncate long values
+
+
+def _parse_vcd(vcd_source: Union[str, Path]) -> VCDData:
+    """Parse VCD from a content string or, for a Path, memory-map it from disk."""
+    # A fresh parser per call: nothing keeps this VCD's signals alive afterwards
+    parser = VCDParser()
+    if isinstance(vcd_source, Path):
+        return parser.parse_file(vcd_source)
+    return parser.parse(vcd_source)
+
+
 def vcd_to_wavedrom(
-    vcd_content: str, 
+    vcd_content: Union[str, Path], 
     io_port_names: List[str] = None,
     port_definitions: List["Port"] = None,
     match_original: bool = False
@@ -517,7 +638,8 @@ def vcd_to_wavedrom(
     """Convenience function to convert VCD to WaveDrom JSON.
     
     Args:
-        vcd_content: VCD file content as string
+        vcd_content: VCD file content as string, or a Path to a VCD file
+                     (memory-mapped and scanned in place, not read into a string)
         io_port_names: Optional list of I/O port names to filter signals
         port_definitions: Optional list of Port objects for signal name formatting
                          and ordering. When provided, signals will be named with
@@ -525,8 +647,7 @@ def vcd_to_wavedrom(
         match_original: If True, include all signals and use VCD order to match
                        original waveform images from the dataset.
     """
-    parser = VCDParser()
-    vcd_data = parser.parse(vcd_content)
+    vcd_data = _parse_vcd(vcd_content)
     
     generator = WaveDromGenerator(
         io_ports_only=not match_original,
@@ -541,26 +662,27 @@ def vcd_to_wavedrom(
 def vcd_to_wavedrom_json(vcd_content: str) -> str:
     """Convert VCD content to WaveDrom JSON string."""
     wavedrom_dict = vcd_to_wavedrom(vcd_content)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(wavedrom_dict, option=orjson.OPT_INDENT_2).decode('utf-8')
     return json.dumps(wavedrom_dict, indent=2)
 
 
 def vcd_to_wavedrom_with_order(
-    vcd_content: str,
+    vcd_content: Union[str, Path],
     signal_order: List[str],
     port_definitions: List["Port"] = None
 ) -> Dict[str, Any]:
     """Convert VCD to WaveDrom with custom signal ordering.
     
     Args:
-        vcd_content: VCD file content as string
+        vcd_content: VCD file content as string, or a Path to a VCD file
         signal_order: List of signal names in desired order
         port_definitions: Optional list of Port objects for signal name formatting
         
     Returns:
         WaveDrom dictionary with signals ordered according to signal_order
     """
-    parser = VCDParser()
-    vcd_data = parser.parse(vcd_content)
+    vcd_data = _parse_vcd(vcd_content)
     
     generator = WaveDromGenerator(
         io_ports_only=False,  # Include all signals
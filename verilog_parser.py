@@ -5,11 +5,75 @@ Supports Verilog-2001 ANSI-style and non-ANSI port declarations.
 """
 
 import re
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import FrozenSet, List, Optional, Set, Tuple
 
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Regex patterns for Verilog parsing
+_MODULE_RE = re.compile(
+    r'module\s+(\w+)\s*'  # module name
+    r'(?:#\s*\((.*?)\))?\s*'  # optional parameters
+    r'\((.*?)\)\s*;',  # port list
+    re.DOTALL
+)
+
+# ANSI-style port in module header: input [7:0] data, input wire clk
+# Handles parameterized widths like [C_WIDTH-1:0]
+_ANSI_PORT_RE = re.compile(
+    r'(input|output|inout)\s+'
+    r'(?:reg\s+|wire\s+)?'  # optional reg/wire (non-capturing)
+    r'(signed\s+)?'  # optional signed
+    r'(?:\[([^\]]+):([^\]]+)\]\s+)?'  # optional bit range with expressions
+    r'(\w+)',  # signal name
+    re.IGNORECASE
+)
+
+# Non-ANSI port declaration: input [7:0] data;
+_PORT_DECL_RE = re.compile(
+    r'(input|output|inout)\s+'
+    r'(reg|wire)?\s*'
+    r'(signed)?\s*'
+    r'(?:\[([^\]]+):([^\]]+)\])?\s*'
+    r'([\w\s,]+)\s*;',
+    re.IGNORECASE
+)
+
+# Parameter or localparam declaration
+_PARAM_RE = re.compile(
+    r'\b(?P<kind>parameter|localparam)\s+'
+    r'(?:\[(?P<msb>\d+):(?P<lsb>\d+)\])?\s*'
+    r'(?P<name>\w+)\s*=\s*(?P<value>[^,;\)]+)',
+    re.IGNORECASE
+)
+
+# Comments: /* ... */ and // ..., whichever starts first
+_COMMENTS_RE = re.compile(r'/\*.*?\*/|//[^\n]*', re.DOTALL)
+
+_ENDMODULE_RE = re.compile(r'\bendmodule\b', re.IGNORECASE)
+
+# Type keywords and bit ranges stripped from a non-ANSI header's port list
+_HEADER_CLEAN_RE = re.compile(r'(input|output|inout|reg|wire|\[[^\]]+\])', re.IGNORECASE)
+_IDENT_RE = re.compile(r'^\w+$')
+
+# Individual names in a multi-name declaration such as "a, b, c"
+_NAME_RE = re.compile(r'\w+')
+
+# Keywords the ANSI port pattern can capture in the name position
+_RESERVED_PORT_WORDS = frozenset(('wire', 'reg', 'signed', 'unsigned'))
+
+# Name fragments that mark clock / reset ports (matched on the lowercased name)
+_CLOCK_NAME_RE = re.compile(r'clk|clock')
+_RESET_NAME_RE = re.compile(r'rst|reset')
+
+# Simple bit index expression like "WIDTH-1"
+_EXPR_MINUS_RE = re.compile(r'(\w+)\s*-\s*(\d+)')
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Port:
     """Represents a Verilog port."""
     name: str
@@ -19,8 +83,10 @@ class Port:
     lsb: Optional[int] = None
     is_reg: bool = False
     is_signed: bool = False
+    name_lower: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        self.name_lower = self.name.lower()
         if self.msb is not None and self.lsb is not None:
             self.width = abs(self.msb - self.lsb) + 1
     
@@ -42,15 +108,16 @@ class Port:
             return f"{self.name}[{msb}:{lsb}]"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Parameter:
     """Represents a Verilog parameter."""
     name: str
     value: str
     width: Optional[int] = None
+    is_local: bool = False  # declared with localparam
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VerilogModule:
     """Represents a parsed Verilog module."""
     name: str
@@ -72,90 +139,43 @@ class VerilogModule:
     
     def get_clock_signals(self) -> List[Port]:
         """Find likely clock signals based on naming conventions."""
-        clock_patterns = ['clk', 'clock', 'CLK', 'CLOCK']
-        return [p for p in self.inputs 
-                if any(pat in p.name.lower() for pat in ['clk', 'clock']) and p.width == 1]
+        return [p for p in self.inputs
+                if p.width == 1 and _CLOCK_NAME_RE.search(p.name_lower)]
     
     def get_reset_signals(self) -> List[Port]:
         """Find likely reset signals based on naming conventions."""
-        return [p for p in self.inputs 
-                if any(pat in p.name.lower() for pat in ['rst', 'reset']) and p.width == 1]
+        return [p for p in self.inputs
+                if p.width == 1 and _RESET_NAME_RE.search(p.name_lower)]
 
 
 class VerilogParser:
     """Parse Verilog code to extract module structure."""
     
-    def __init__(self):
-        # Regex patterns for Verilog parsing
-        self._module_pattern = re.compile(
-            r'module\s+(\w+)\s*'  # module name
-            r'(?:#\s*\((.*?)\))?\s*'  # optional parameters
-            r'\((.*?)\)\s*;',  # port list
-            re.DOTALL
-        )
-        
-        # ANSI-style port in module header: input [7:0] data, input wire clk
-        # Handles parameterized widths like [C_WIDTH-1:0]
-        self._ansi_port_pattern = re.compile(
-            r'(input|output|inout)\s+'
-            r'(?:reg\s+|wire\s+)?'  # optional reg/wire (non-capturing)
-            r'(signed\s+)?'  # optional signed
-            r'(?:\[([^\]]+):([^\]]+)\]\s+)?'  # optional bit range with expressions
-            r'(\w+)',  # signal name
-            re.IGNORECASE
-        )
-        
-        # Non-ANSI port declaration: input [7:0] data;
-        self._port_decl_pattern = re.compile(
-            r'(input|output|inout)\s+'
-            r'(reg|wire)?\s*'
-            r'(signed)?\s*'
-            r'(?:\[([^\]]+):([^\]]+)\])?\s*'
-            r'([\w\s,]+)\s*;',
-            re.IGNORECASE
-        )
-        
-        # Parameter declaration
-        self._param_pattern = re.compile(
-            r'parameter\s+'
-            r'(?:\[(\d+):(\d+)\])?\s*'
-            r'(\w+)\s*=\s*([^,;\)]+)',
-            re.IGNORECASE
-        )
-        
-        # Localparam declaration
-        self._localparam_pattern = re.compile(
-            r'localparam\s+'
-            r'(?:\[(\d+):(\d+)\])?\s*'
-            r'(\w+)\s*=\s*([^,;]+)',
-            re.IGNORECASE
-        )
-    
     def parse(self, verilog_code: str) -> Optional[VerilogModule]:
         """Parse Verilog code and return module structure."""
         # Remove comments
         code = self._remove_comments(verilog_code)
         
         # Find module declaration
-        module_match = self._module_pattern.search(code)
+        module_match = _MODULE_RE.search(code)
         if not module_match:
             return None
         
-        module_name = module_match.group(1)
-        param_section = module_match.group(2) or ""
-        port_section = module_match.group(3) or ""
+        module_name, param_section, port_section = module_match.groups()
+        param_section = param_section or ""
+        port_section = port_section or ""
         
         # Parse parameters from #(...) section
         parameters = self._parse_parameters(param_section)
         
-        # Also parse parameters from module body
+        # Also parse parameters from module body (scanned in place, not sliced)
         body_start = module_match.end()
-        endmodule_match = re.search(r'\bendmodule\b', code[body_start:], re.IGNORECASE)
+        endmodule_match = _ENDMODULE_RE.search(code, body_start)
         if endmodule_match:
-            module_body = code[body_start:body_start + endmodule_match.start()]
-            parameters.extend(self._parse_parameters(module_body))
+            body_end = endmodule_match.start()
+            parameters.extend(self._parse_parameters(code, body_start, body_end))
         else:
-            module_body = code[body_start:]
+            body_end = len(code)
         
         # Try ANSI-style ports first (in module header)
         ports = self._parse_ansi_ports(port_section)
@@ -163,7 +183,7 @@ class VerilogParser:
         # If no ANSI ports found, look for non-ANSI declarations in body
         if not ports:
             port_names = self._extract_port_names(port_section)
-            ports = self._parse_non_ansi_ports(module_body, port_names)
+            ports = self._parse_non_ansi_ports(code, port_names, body_start, body_end)
         
         return VerilogModule(
             name=module_name,
@@ -173,46 +193,46 @@ class VerilogParser:
         )
     
     def _remove_comments(self, code: str) -> str:
-        """Remove single-line and multi-line comments."""
-        # Remove multi-line comments /* ... */
-        code = re.sub(r'/\*.*?\*/', '', code, flags=re.DOTALL)
-        # Remove single-line comments // ...
-        code = re.sub(r'//.*$', '', code, flags=re.MULTILINE)
-        return code
+        """Remove single-line and multi-line comments in one pass."""
+        return _COMMENTS_RE.sub('', code)
     
-    def _parse_parameters(self, text: str) -> List[Parameter]:
-        """Parse parameter declarations."""
-        parameters = []
+    def _parse_parameters(
+        self,
+        text: str,
+        pos: int = 0,
+        endpos: int = sys.maxsize
+    ) -> List[Parameter]:
+        """Parse parameter and localparam declarations in text[pos:endpos] in one pass."""
+        parameters: List[Parameter] = []
         
-        for match in self._param_pattern.finditer(text):
-            msb, lsb, name, value = match.groups()
-            width = None
+        for match in _PARAM_RE.finditer(text, pos, endpos):
+            kind, msb, lsb, name, value = match.groups()
+            width: Optional[int] = None
             if msb is not None and lsb is not None:
                 width = abs(int(msb) - int(lsb)) + 1
             parameters.append(Parameter(
                 name=name.strip(),
                 value=value.strip().rstrip(','),
-                width=width
+                width=width,
+                is_local=kind.lower() == 'localparam'
             ))
         
         return parameters
     
     def _parse_ansi_ports(self, port_section: str) -> List[Port]:
         """Parse ANSI-style port declarations from module header."""
-        ports = []
-        seen_names = set()
+        ports: List[Port] = []
+        seen_names: Set[str] = set()
         
         # Split by comma, but be careful with bit ranges
         # Use regex to find all port declarations
-        for match in self._ansi_port_pattern.finditer(port_section):
-            direction = match.group(1).lower()
-            is_signed = match.group(2) is not None
-            msb_str = match.group(3)
-            lsb_str = match.group(4)
-            name = match.group(5)
+        for match in _ANSI_PORT_RE.finditer(port_section):
+            direction, signed, msb_str, lsb_str, name = match.groups()
+            direction = direction.lower()
+            is_signed: bool = signed is not None
             
             # Skip if name is a reserved word (wire, reg, etc.)
-            if name.lower() in ('wire', 'reg', 'signed', 'unsigned'):
+            if name.lower() in _RESERVED_PORT_WORDS:
                 continue
             
             # Skip duplicates
@@ -221,24 +241,18 @@ class VerilogParser:
             seen_names.add(name)
             
             # Parse bit indices
-            msb = self._parse_bit_index(msb_str)
-            lsb = self._parse_bit_index(lsb_str)
+            msb: Optional[int] = self._parse_bit_index(msb_str)
+            lsb: Optional[int] = self._parse_bit_index(lsb_str)
             
-            # Determine width - use 8 as default for parameterized widths
-            width = 1
-            if msb_str is not None and lsb_str is not None:
-                if msb is not None and lsb is not None:
-                    width = abs(msb - lsb) + 1
-                else:
-                    # Parameterized width - default to 8
-                    width = 8
-                    msb = 7
-                    lsb = 0
+            # Parameterized width - default to 8 bits ([7:0])
+            if msb_str is not None and (msb is None or lsb is None):
+                msb = 7
+                lsb = 0
             
+            # Port derives width from msb/lsb (1 when there is no range)
             ports.append(Port(
                 name=name,
                 direction=direction,
-                width=width,
                 msb=msb,
                 lsb=lsb,
                 is_reg=False,
@@ -250,32 +264,35 @@ class VerilogParser:
     def _extract_port_names(self, port_section: str) -> List[str]:
         """Extract port names from non-ANSI module header."""
         # Remove any type declarations that might be in header
-        clean = re.sub(r'(input|output|inout|reg|wire|\[[^\]]+\])', '', port_section, flags=re.IGNORECASE)
+        clean = _HEADER_CLEAN_RE.sub('', port_section)
         # Split by comma and clean up
         names = [n.strip() for n in clean.split(',')]
-        return [n for n in names if n and re.match(r'^\w+$', n)]
+        return [n for n in names if n and _IDENT_RE.match(n)]
     
-    def _parse_non_ansi_ports(self, body: str, port_names: List[str]) -> List[Port]:
-        """Parse non-ANSI port declarations from module body."""
-        ports = []
-        port_name_set = set(port_names)
+    def _parse_non_ansi_ports(
+        self,
+        body: str,
+        port_names: List[str],
+        pos: int = 0,
+        endpos: int = sys.maxsize
+    ) -> List[Port]:
+        """Parse non-ANSI port declarations from module body (body[pos:endpos])."""
+        ports: List[Port] = []
+        port_name_set: FrozenSet[str] = frozenset(port_names)
         
-        for match in self._port_decl_pattern.finditer(body):
-            direction = match.group(1).lower()
-            is_reg = match.group(2) and match.group(2).lower() == 'reg'
-            is_signed = match.group(3) is not None
-            msb_str = match.group(4)
-            lsb_str = match.group(5)
-            names_str = match.group(6)
+        for match in _PORT_DECL_RE.finditer(body, pos, endpos):
+            direction, net_type, signed, msb_str, lsb_str, names_str = match.groups()
+            direction = direction.lower()
+            is_reg: bool = net_type is not None and net_type.lower() == 'reg'
+            is_signed: bool = signed is not None
             
             # Parse bit range - might contain parameters
-            msb = self._parse_bit_index(msb_str) if msb_str else None
-            lsb = self._parse_bit_index(lsb_str) if lsb_str else None
+            msb: Optional[int] = self._parse_bit_index(msb_str) if msb_str else None
+            lsb: Optional[int] = self._parse_bit_index(lsb_str) if lsb_str else None
             
             # Split multiple port names
-            for name in names_str.split(','):
-                name = name.strip()
-                if name and (not port_name_set or name in port_name_set):
+            for name in _NAME_RE.findall(names_str):
+                if not port_name_set or name in port_name_set:
                     ports.append(Port(
                         name=name,
                         direction=direction,
@@ -287,7 +304,7 @@ class VerilogParser:
         
         return ports
     
-    def _parse_bit_index(self, index_str: str) -> Optional[int]:
+    def _parse_bit_index(self, index_str: Optional[str]) -> Optional[int]:
         """Parse a bit index, which might be a number or expression."""
         if index_str is None:
             return None
@@ -300,7 +317,7 @@ class VerilogParser:
             pass
         
         # Try simple expression like "WIDTH-1"
-        match = re.match(r'(\w+)\s*-\s*(\d+)', index_str)
+        match = _EXPR_MINUS_RE.match(index_str)
         if match:
             # Return None for parameterized widths - will default to 8
             return None
@@ -1,26 +1,75 @@
 """
-WaveDrom Renderer - Render WaveDrom JSON to PNG images.
+WaveDrom Renderer - Render WaveDrom JSON to PNG or SVG images.
 
 Supports multiple rendering backends:
-1. Python wavedrom + Playwright (headless browser)
-2. Python wavedrom + cairosvg
+1. Python wavedrom + cairosvg (native SVG rasterizer, fastest)
+2. Python wavedrom + Playwright (headless browser)
 3. wavedrom-cli (Node.js)
+
+SVG output skips rasterization entirely and is preferred for docs/markdown.
 """
 
+import functools
+import hashlib
 import json
 import shutil
 import subprocess
 import tempfile
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+# Try to import orjson (optional, faster JSON encoding)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_json(obj: Any, sort_keys: bool = False) -> bytes:
+    """Encode obj as compact UTF-8 JSON, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys, separators=(',', ':')).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def _npx_path() -> Optional[str]:
+    """Resolve npx on PATH once per process."""
+    return shutil.which('npx')
+
+
+@functools.lru_cache(maxsize=1)
+def _wavedrom_cli_command() -> List[str]:
+    """Command prefix for wavedrom-cli, resolved once per process.
+    
+    A globally installed wavedrom-cli is run directly, skipping npx's
+    package resolution and its extra Node.js process.
+    """
+    cli_path = shutil.which('wavedrom-cli')
+    if cli_path:
+        return [cli_path]
+    return [_npx_path() or 'npx', 'wavedrom-cli']
 
 
 def check_dependencies() -> Dict[str, bool]:
-    """Check which rendering methods are available."""
+    """Check which rendering methods are available.
+    
+    The probes run once per process; each call returns a fresh copy.
+    """
+    return dict(_probe_dependencies())
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_dependencies() -> Dict[str, bool]:
+    """Probe the rendering backends (cached by check_dependencies)."""
     deps = {}
     
     # Check for wavedrom-cli (npx wavedrom-cli)
-    deps['wavedrom-cli'] = shutil.which('npx') is not None
+    deps['wavedrom-cli'] = _npx_path() is not None or shutil.which('wavedrom-cli') is not None
     
     # Check for Python wavedrom library
     try:
@@ -46,28 +95,220 @@ def check_dependencies() -> Dict[str, bool]:
     return deps
 
 
+# Page wrapped around the SVG for the Playwright backend
+_HTML_PREFIX = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <style>
+        body { margin: 0; padding: 10px; background: white; }
+        svg { display: block; }
+    </style>
+</head>
+<body>
+"""
+_HTML_SUFFIX = """
+</body>
+</html>"""
+
+
+def _stop_playwright(playwright, browser) -> None:
+    """Close a headless browser and its Playwright driver, ignoring shutdown errors."""
+    for stop in (browser.close, playwright.stop):
+        try:
+            stop()
+        except Exception:
+            pass
+
+
 class WaveDromRenderer:
-    """Render WaveDrom JSON to PNG images."""
+    """Render WaveDrom JSON to PNG images.
+    
+    The Playwright backend keeps one headless browser open across renders.
+    Use the renderer as a context manager (or call close()) to shut it down
+    early; otherwise it is closed when the renderer is garbage collected.
     
-    def __init__(self):
+    Rendered PNGs are cached by WaveDrom JSON content, so repeated diagrams
+    are only rendered once.
+    """
+    
+    # Maximum number of rendered PNGs kept in memory
+    RENDER_CACHE_SIZE = 256
+    
+    def __init__(self, prefer_browser: bool = False):
+        """Initialize the renderer.
+        
+        Args:
+            prefer_browser: Try the Playwright backend before cairosvg
+                            (cairosvg needs no browser and is much faster)
+        """
         self.deps = check_dependencies()
+        self.prefer_browser = prefer_browser
+        # Content hash of WaveDrom JSON -> PNG bytes, least recently used first
+        self._render_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        # Headless browser reused by Playwright renders (started on first use)
+        self._page = None
+        self._browser_finalizer = None
+    
+    def __enter__(self) -> "WaveDromRenderer":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the cached headless browser, if one was started."""
+        if self._browser_finalizer is not None:
+            self._browser_finalizer()
+        self._page = None
+        self._browser_finalizer = None
+    
+    def _get_page(self):
+        """Return the cached Playwright page, launching the browser on first use."""
+        if self._page is None:
+            from playwright.sync_api import sync_playwright
+            
+            playwright = sync_playwright().start()
+            try:
+                browser = playwright.chromium.launch(headless=True)
+            except Exception:
+                playwright.stop()
+                raise
+            self._browser_finalizer = weakref.finalize(self, _stop_playwright, playwright, browser)
+            self._page = browser.new_page()
+        return self._page
     
     def render_to_png(self, wavedrom_dict: Dict[str, Any]) -> bytes:
-        """Render WaveDrom JSON to PNG bytes."""
-        # Try Python wavedrom + Playwright first (most reliable on Windows)
-        if self.deps.get('wavedrom-py') and self.deps.get('playwright'):
+        """Render WaveDrom JSON to PNG bytes, reusing earlier renders of equal JSON."""
+        key = self._cache_key(wavedrom_dict)
+        
+        png_bytes = self._render_cache.get(key)
+        if png_bytes is not None:
+            self._render_cache.move_to_end(key)
+            return png_bytes
+        
+        png_bytes = self._render_uncached(wavedrom_dict)
+        self._remember(key, png_bytes)
+        return png_bytes
+    
+    def render_to_svg(self, wavedrom_dict: Dict[str, Any]) -> bytes:
+        """Render WaveDrom JSON to SVG bytes, without any PNG rasterization."""
+        if self.deps.get('wavedrom-py'):
             try:
-                return self._render_with_playwright(wavedrom_dict)
-            except Exception as e:
-                # Fall through to other methods if Playwright fails
-                pass
+                return self._to_svg(wavedrom_dict).encode('utf-8')
+            except Exception:
+                # Fall back to wavedrom-cli, as the PNG path does
+                if not self.deps.get('wavedrom-cli'):
+                    raise
+        
+        if self.deps.get('wavedrom-cli'):
+            return self._render_with_cli(wavedrom_dict, svg=True)
         
-        # Try Python wavedrom + cairosvg
-        if self.deps.get('wavedrom-py') and self.deps.get('cairosvg'):
+        raise RuntimeError(
+            "No SVG rendering method available. Install one of:\n"
+            "  - pip install wavedrom\n"
+            "  - npm install -g wavedrom-cli"
+        )
+    
+    def render_many(
+        self,
+        wavedrom_dicts: List[Dict[str, Any]],
+        workers: Optional[int] = None
+    ) -> List[bytes]:
+        """Render several WaveDrom diagrams to PNG bytes.
+        
+        Repeated diagrams are rendered once. When wavedrom-cli is the only
+        backend available, the CLI runs for different diagrams are started
+        concurrently, so their Node.js start-up overlaps instead of adding up.
+        With the Python backends, ``workers`` > 1 spreads the diagrams over a
+        process pool; each worker keeps its own renderer (and browser) open
+        for all the diagrams it is given.
+        
+        Args:
+            wavedrom_dicts: WaveDrom JSON dicts to render
+            workers: Maximum concurrent wavedrom-cli processes (default: thread
+                     pool default), or worker processes for the Python backends
+                     (default: render in this process)
+            
+        Returns:
+            PNG bytes for each dict, in the same order
+        """
+        keys = [self._cache_key(d) for d in wavedrom_dicts]
+        rendered: Dict[bytes, bytes] = {}
+        pending = {
+            key: d for key, d in zip(keys, wavedrom_dicts)
+            if key not in self._render_cache
+        }
+        
+        if pending and self._cli_only():
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    key: executor.submit(self._render_with_cli, d)
+                    for key, d in pending.items()
+                }
+                for key, future in futures.items():
+                    rendered[key] = future.result()
+                    self._remember(key, rendered[key])
+        elif len(pending) > 1 and workers is not None and workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_render_worker,
+                initargs=(self.prefer_browser,)
+            ) as executor:
+                for key, png_bytes in zip(pending, executor.map(_render_in_worker, pending.values())):
+                    rendered[key] = png_bytes
+                    self._remember(key, png_bytes)
+        
+        return [
+            rendered[key] if key in rendered else self.render_to_png(d)
+            for key, d in zip(keys, wavedrom_dicts)
+        ]
+    
+    @staticmethod
+    def _cache_key(wavedrom_dict: Dict[str, Any]) -> bytes:
+        """Content hash of WaveDrom JSON (equal dicts share a key regardless of key order)."""
+        canonical = _dumps_json(wavedrom_dict, sort_keys=True)
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+    
+    def _remember(self, key: bytes, png_bytes: bytes) -> None:
+        """Store a rendered PNG, evicting the least recently used beyond RENDER_CACHE_SIZE."""
+        self._render_cache[key] = png_bytes
+        self._render_cache.move_to_end(key)
+        if len(self._render_cache) > self.RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+    
+    def _cli_only(self) -> bool:
+        """True if wavedrom-cli is the only rendering backend available."""
+        python_backend = self.deps.get('wavedrom-py') and (
+            self.deps.get('cairosvg') or self.deps.get('playwright')
+        )
+        return bool(self.deps.get('wavedrom-cli')) and not python_backend
+    
+    def _render_uncached(self, wavedrom_dict: Dict[str, Any]) -> bytes:
+        """Render WaveDrom JSON with the first backend that works."""
+        # Python wavedrom backends: cairosvg first, Playwright if preferred
+        svg_backends = [
+            ('cairosvg', self._render_with_cairosvg),
+            ('playwright', self._render_with_playwright),
+        ]
+        if self.prefer_browser:
+            svg_backends.reverse()
+        
+        if self.deps.get('wavedrom-py') and any(self.deps.get(dep) for dep, _ in svg_backends):
             try:
-                return self._render_with_cairosvg(wavedrom_dict)
+                # Generate the SVG once for whichever backend succeeds
+                svg_str = self._to_svg(wavedrom_dict)
             except Exception:
-                pass
+                svg_str = None
+            
+            if svg_str is not None:
+                for dep, render in svg_backends:
+                    if self.deps.get(dep):
+                        try:
+                            return render(svg_str)
+                        except Exception:
+                            # Fall through to the next method if this one fails
+                            pass
         
         # Fall back to wavedrom-cli
         if self.deps.get('wavedrom-cli'):
@@ -80,101 +321,104 @@ class WaveDromRenderer:
             "  - npm install -g wavedrom-cli"
         )
     
-    def _render_with_playwright(self, wavedrom_dict: Dict[str, Any]) -> bytes:
-        """Render using Python wavedrom + Playwright headless browser."""
+    @staticmethod
+    def _to_svg(wavedrom_dict: Dict[str, Any]) -> str:
+        """Generate SVG markup using the Python wavedrom library."""
         import wavedrom
-        from playwright.sync_api import sync_playwright
-        
-        # Generate SVG using wavedrom library (needs JSON string, not dict)
-        svg = wavedrom.render(json.dumps(wavedrom_dict))
-        svg_str = svg.tostring()
         
-        # Create HTML page with SVG
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{ margin: 0; padding: 10px; background: white; }}
-        svg {{ display: block; }}
-    </style>
-</head>
-<body>
-{svg_str}
-</body>
-</html>"""
+        # wavedrom.render needs a JSON string, not a dict
+        svg = wavedrom.render(_dumps_json(wavedrom_dict).decode('utf-8'))
+        return svg.tostring()
+    
+    def _render_with_playwright(self, svg_str: str) -> bytes:
+        """Render SVG using Playwright headless browser."""
+        html_content = _HTML_PREFIX + svg_str + _HTML_SUFFIX
         
-        # Use Playwright to render to PNG
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            html_file = tmpdir / "waveform.html"
-            html_file.write_text(html_content, encoding='utf-8')
+        # Use Playwright to render to PNG, loading the page straight from memory
+        try:
+            page = self._get_page()
+            page.set_content(html_content, wait_until="load")
             
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.goto(f"file:///{html_file.as_posix()}")
-                
-                # Wait for SVG to render
-                page.wait_for_selector("svg")
-                
-                # Get SVG bounding box and screenshot
-                svg_element = page.query_selector("svg")
-                png_bytes = svg_element.screenshot()
-                
-                browser.close()
-                
-            return png_bytes
+            # Wait for SVG to render
+            page.wait_for_selector("svg")
+            
+            # Get SVG bounding box and screenshot
+            svg_element = page.query_selector("svg")
+            return svg_element.screenshot()
+        except Exception:
+            # Don't reuse a browser that may be in a bad state
+            self.close()
+            raise
     
-    def _render_with_cairosvg(self, wavedrom_dict: Dict[str, Any]) -> bytes:
-        """Render using Python wavedrom + cairosvg."""
-        import wavedrom
+    def _render_with_cairosvg(self, svg_str: str) -> bytes:
+        """Render SVG using cairosvg."""
         import cairosvg
         
-        # Generate SVG (needs JSON string, not dict)
-        svg = wavedrom.render(json.dumps(wavedrom_dict))
-        svg_str = svg.tostring()
-        
         # Convert SVG to PNG
         png_bytes = cairosvg.svg2png(bytestring=svg_str)
         return png_bytes
     
-    def _render_with_cli(self, wavedrom_dict: Dict[str, Any]) -> bytes:
-        """Render using wavedrom-cli."""
+    def _render_with_cli(self, wavedrom_dict: Dict[str, Any], svg: bool = False) -> bytes:
+        """Render using wavedrom-cli (PNG, or SVG if svg is set)."""
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
             
             # Write JSON file
             json_file = tmpdir / "waveform.json"
-            json_file.write_text(json.dumps(wavedrom_dict), encoding='utf-8')
+            json_file.write_bytes(_dumps_json(wavedrom_dict))
             
-            # Output PNG file
-            png_file = tmpdir / "waveform.png"
+            # Output PNG/SVG file
+            if svg:
+                out_flag, out_file = '-s', tmpdir / "waveform.svg"
+            else:
+                out_flag, out_file = '-p', tmpdir / "waveform.png"
             
             # Run wavedrom-cli
             try:
+                # stdout is never used; stderr stays bytes unless reporting a failure
                 result = subprocess.run(
-                    ['npx', 'wavedrom-cli', '-i', str(json_file), '-p', str(png_file)],
-                    capture_output=True,
-                    text=True,
+                    _wavedrom_cli_command() + ['-i', str(json_file), out_flag, str(out_file)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     timeout=30
                 )
                 
                 if result.returncode != 0:
-                    raise RuntimeError(f"wavedrom-cli failed: {result.stderr}")
+                    stderr = result.stderr.decode('utf-8', errors='replace')
+                    raise RuntimeError(f"wavedrom-cli failed: {stderr}")
                 
-                # Read PNG file
-                return png_file.read_bytes()
+                # Read output file
+                return out_file.read_bytes()
                 
             except subprocess.TimeoutExpired:
                 raise RuntimeError("wavedrom-cli timed out")
             except FileNotFoundError:
-                raise RuntimeError("npx not found - install Node.js")
+                raise RuntimeError(f"{_wavedrom_cli_command()[0]} not found - install Node.js")
     
     def render_to_file(self, wavedrom_dict: Dict[str, Any], output_path: Path) -> None:
-        """Render WaveDrom JSON to a PNG file."""
+        """Render WaveDrom JSON to a PNG file, or an SVG file if output_path ends in .svg."""
+        output_path = Path(output_path)
+        if output_path.suffix.lower() == '.svg':
+            output_path.write_bytes(self.render_to_svg(wavedrom_dict))
+            return
+        
         png_bytes = self.render_to_png(wavedrom_dict)
-        Path(output_path).write_bytes(png_bytes)
+        output_path.write_bytes(png_bytes)
+
+
+# Renderer of a render_many worker process (its browser stays open between tasks)
+_worker_renderer: Optional[WaveDromRenderer] = None
+
+
+def _init_render_worker(prefer_browser: bool) -> None:
+    """Create the worker process's renderer."""
+    global _worker_renderer
+    _worker_renderer = WaveDromRenderer(prefer_browser=prefer_browser)
+
+
+def _render_in_worker(wavedrom_dict: Dict[str, Any]) -> bytes:
+    """Render one diagram with the worker process's renderer."""
+    return _worker_renderer.render_to_png(wavedrom_dict)
 
 
 if __name__ == "__main__":
@@ -193,9 +437,9 @@ if __name__ == "__main__":
                 {"name": "data", "wave": "x.=.=", "data": ["A", "B"]}
             ]
         }
-        renderer = WaveDromRenderer()
-        try:
-            png_bytes = renderer.render_to_png(test_wavedrom)
-            print(f"  Rendering successful! PNG size: {len(png_bytes)} bytes")
-        except Exception as e:
-            print(f"  Rendering failed: {e}")
+        with WaveDromRenderer() as renderer:
+            try:
+                png_bytes = renderer.render_to_png(test_wavedrom)
+                print(f"  Rendering successful! PNG size: {len(png_bytes)} bytes")
+            except Exception as e:
+                print(f"  Rendering failed: {e}")